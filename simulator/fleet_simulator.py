@@ -6,17 +6,117 @@ Streams virtual freezer data from historical dataset to server.
 Each virtual unit has a distinct "personality" based on fault patterns in the data.
 """
 
+import aiohttp
+import asyncio
+import numpy as np
+import orjson
 import pandas as pd
 import requests
+from requests.adapters import HTTPAdapter
 import time
-import random
 import argparse
-from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
 from pathlib import Path
 
+try:
+    from numba import njit
+except ImportError:  # numba is optional; kernels run as plain Python without it
+    def njit(*args, **kwargs):
+        def wrap(fn):
+            return fn
+        return wrap
+
 # Server configuration
 SERVER_URL = "http://localhost:4000/api/data"
 
+# Columns actually consumed by the simulator
+REQUIRED_COLUMNS = [
+    "T_cab_meas", "T_amb", "door_open", "defrost_on", "P_comp_W",
+    "N_comp_Hz", "frost_level", "COP", "fault", "fault_id"
+]
+
+# Explicit dtypes so the CSV parser skips inference and avoids float64
+# where sensor precision doesn't need it
+COLUMN_DTYPES = {
+    "T_cab_meas": np.float32,
+    "T_amb": np.float32,
+    "door_open": np.int8,
+    "defrost_on": np.int8,
+    "P_comp_W": np.float32,
+    "N_comp_Hz": np.float32,
+    "frost_level": np.float32,
+    "COP": np.float32,
+    "fault_id": np.int16,
+}
+
+# Fault names for the ids the JIT kernels can emit
+FAULT_NAMES = {0: "NORMAL", 3: "COMPRESSOR_FAIL"}
+
+
+# Numeric kernels for the per-reading math, one per personality. Kept as
+# free functions over plain arrays/scalars so Numba can compile them; only
+# JSON-dict assembly stays in Python.
+
+@njit(cache=True)
+def _healthy_kernel(row, t_amb, defrost_on, p_comp, n_comp, cop, jitter):
+    # Only the fields this personality overwrites are synthetic; ambient,
+    # defrost and compressor figures still come from the dataset row
+    temp_cabinet = -18.0 * (1.0 + 0.05 * jitter[2])
+    frost_level = 0.05 * (1.0 + 0.1 * jitter[3])
+    return (temp_cabinet, t_amb[row], False, defrost_on[row],
+            p_comp[row], n_comp[row], frost_level, cop[row], 0)
+
+
+@njit(cache=True)
+def _door_abuser_kernel(row, t_amb, defrost_on, p_comp, n_comp, frost, cop, jitter):
+    # Map a pre-drawn uniform in [-1, 1] to a 30% door-open chance
+    door_open = (jitter[5] + 1.0) * 0.5 < 0.3
+    if door_open:
+        temp_cabinet = -12.0 * (1.0 + 0.1 * jitter[2])
+    else:
+        temp_cabinet = -17.0 * (1.0 + 0.05 * jitter[2])
+    return (temp_cabinet, t_amb[row], door_open, defrost_on[row],
+            p_comp[row], n_comp[row], frost[row], cop[row], 0)
+
+
+@njit(cache=True)
+def _dying_compressor_kernel(idx, row, t_amb, door_open, defrost_on, frost, cop, jitter):
+    base_temp = min(-10.0 + (idx / 1000.0), 5.0)  # Slowly rising
+    temp_cabinet = base_temp * (1.0 + 0.1 * jitter[2])
+    compressor_power = 700.0 * (1.0 + 0.1 * jitter[3])
+    compressor_freq = 95.0 * (1.0 + 0.05 * jitter[4])
+    fault_id = 3 if temp_cabinet > -5.0 else 0
+    return (temp_cabinet, t_amb[row], door_open[row], defrost_on[row],
+            compressor_power, compressor_freq, frost[row], cop[row], fault_id)
+
+
+@njit(cache=True)
+def _frost_builder_kernel(row, t_amb, door_open, defrost_on, p_comp, n_comp, cop, jitter):
+    temp_cabinet = -16.0 * (1.0 + 0.05 * jitter[2])
+    frost_level = min(0.6 * (1.0 + 0.1 * jitter[3]), 1.0)  # Cap at 1.0
+    return (temp_cabinet, t_amb[row], door_open[row], defrost_on[row],
+            p_comp[row], n_comp[row], frost_level, cop[row], 0)
+
+
+@njit(cache=True)
+def _energy_hog_kernel(row, t_amb, door_open, defrost_on, n_comp, frost, jitter):
+    # Power, efficiency and cabinet temp are synthetic; the door, defrost,
+    # frequency and frost readings still come from the dataset row
+    temp_cabinet = -17.0 * (1.0 + 0.05 * jitter[2])
+    compressor_power = 650.0 * (1.0 + 0.1 * jitter[3])
+    cop = 1.5 * (1.0 + 0.1 * jitter[4])  # Low efficiency
+    return (temp_cabinet, t_amb[row], door_open[row], defrost_on[row],
+            compressor_power, n_comp[row], frost[row], cop, 0)
+
+
+def _box_kernel_result(vals: tuple) -> tuple:
+    """Attach the fault name; orjson serializes the NumPy scalars natively."""
+    (t_cab, t_amb, door, defrost, power, freq, frost, cop, fault_id) = vals
+    fault_id = int(fault_id)
+    return (t_cab, t_amb, door, defrost, power, freq, frost, cop,
+            FAULT_NAMES[fault_id], fault_id)
+
 # Virtual fleet configuration - UK locations
 FLEET_CONFIG = [
     {
@@ -68,180 +168,293 @@ class FreezerSimulator:
         self.csv_path = csv_path
         self.df = None
         self.unit_indices = {}  # Track position in data for each unit
-        self.unit_data = {}     # Filtered data per unit
-
-    def load_data(self):
-        """Load and preprocess the CSV dataset."""
-        print(f"Loading dataset from {self.csv_path}...")
-        self.df = pd.read_csv(self.csv_path)
+        self.df_arrays = {}     # Column arrays over the whole dataset (struct-of-arrays)
+        self.unit_row_idx = {}  # Per-unit row indices into df_arrays
+
+        # Personality dispatch table, built once instead of re-evaluating a
+        # string if/elif chain on every reading
+        self._personality_fns = {
+            "healthy": self._read_healthy,
+            "door_abuser": self._read_door_abuser,
+            "dying_compressor": self._read_dying_compressor,
+            "frost_builder": self._read_frost_builder,
+            "energy_hog": self._read_energy_hog,
+        }
+        self._unit_cache = {}   # Per-unit immutable fields + reader fn + rows
+        self._rng = np.random.default_rng()  # PCG64
+        # Reused each iteration: one row of pre-drawn uniforms per unit
+        self._jitter_buf = np.empty((len(FLEET_CONFIG), 16))
+
+        # Pooled session for the synchronous path: one connection pool sized
+        # to the fleet, reused across iterations instead of a fresh TCP
+        # handshake per requests.post call
+        self._session = requests.Session()
+        self._session.headers.update({"Content-Type": "application/json"})
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=len(FLEET_CONFIG))
+        self._session.mount("http://", adapter)
+        self._session.mount("https://", adapter)
+
+        # Fans out the sync path's POSTs; workers spend their time in
+        # GIL-releasing socket waits, so one thread per unit is enough
+        self._executor = ThreadPoolExecutor(max_workers=len(FLEET_CONFIG))
+
+    def load_data(self, use_cache: bool = False):
+        """Load and preprocess the dataset.
+
+        With use_cache, the CSV is converted once to a Parquet sidecar and
+        subsequent startups memory-map that file instead of re-parsing text.
+        """
+        if use_cache:
+            parquet_path = Path(self.csv_path).with_suffix(".parquet")
+            if (not parquet_path.exists()
+                    or parquet_path.stat().st_mtime < Path(self.csv_path).stat().st_mtime):
+                print(f"Building Parquet cache at {parquet_path}...")
+                pd.read_csv(
+                    self.csv_path, usecols=REQUIRED_COLUMNS, dtype=COLUMN_DTYPES
+                ).to_parquet(parquet_path, engine="pyarrow")
+            print(f"Loading dataset from {parquet_path} (memory-mapped)...")
+            self.df = pd.read_parquet(
+                parquet_path,
+                engine="pyarrow",
+                columns=REQUIRED_COLUMNS,
+                memory_map=True
+            ).astype(COLUMN_DTYPES)
+        else:
+            print(f"Loading dataset from {self.csv_path}...")
+            self.df = pd.read_csv(
+                self.csv_path,
+                usecols=REQUIRED_COLUMNS,
+                dtype=COLUMN_DTYPES,
+                engine="c"
+            )
         print(f"Loaded {len(self.df):,} rows")
 
         # Prepare data slices for each personality type
         self._prepare_unit_data()
 
+    def _load_thresholds(self):
+        """Load or compute dataset-derived thresholds.
+
+        The median power and frost row indices are deterministic for a given
+        dataset, so they are cached in a sidecar .npz keyed on the CSV's
+        mtime and only recomputed when the dataset changes.
+        """
+        sidecar = Path(self.csv_path).with_suffix(".thresholds.npz")
+        if (sidecar.exists()
+                and sidecar.stat().st_mtime >= Path(self.csv_path).stat().st_mtime):
+            cached = np.load(sidecar)
+            return float(cached["median_power"][0]), cached["frost_indices"]
+
+        # Quickselect the middle element instead of pandas' nan-aware median;
+        # O(N) expected and no pandas dispatch. Good enough for a threshold.
+        power = self.df_arrays["P_comp_W"]
+        median_power = float(np.partition(power, power.size // 2)[power.size // 2])
+        frost_indices = np.flatnonzero(self.df_arrays["frost_level"] > 0.1)
+        np.savez(sidecar, median_power=np.array([median_power]),
+                 frost_indices=frost_indices)
+        return median_power, frost_indices
+
     def _prepare_unit_data(self):
-        """Prepare filtered data for each unit based on personality."""
+        """Prepare shared column arrays and per-personality row indices."""
+        # One set of contiguous column arrays over the whole dataset, shared
+        # by every unit; personalities only differ in which rows they walk,
+        # so each unit stores an index array instead of a filtered copy
+        self.df_arrays = {
+            "T_cab_meas": self.df["T_cab_meas"].to_numpy(dtype=np.float32),
+            "T_amb": self.df["T_amb"].to_numpy(dtype=np.float32),
+            "door_open": self.df["door_open"].to_numpy(dtype=np.bool_),
+            "defrost_on": self.df["defrost_on"].to_numpy(dtype=np.bool_),
+            "P_comp_W": self.df["P_comp_W"].to_numpy(dtype=np.float32),
+            "N_comp_Hz": self.df["N_comp_Hz"].to_numpy(dtype=np.float32),
+            "frost_level": self.df["frost_level"].to_numpy(dtype=np.float32),
+            "COP": self.df["COP"].to_numpy(dtype=np.float32),
+            "fault": self.df["fault"].to_numpy(dtype=object),
+            "fault_id": self.df["fault_id"].to_numpy(dtype=np.int16),
+        }
+
+        median_power, frost_indices = self._load_thresholds()
+
+        # Masks run on the extracted arrays; no pandas boolean Series or
+        # intermediate DataFrames. The NORMAL mask is shared by three
+        # personalities, so compute it once.
+        normal_mask = self.df_arrays["fault"] == "NORMAL"
+        normal_idx = np.flatnonzero(normal_mask)
+
         for unit in FLEET_CONFIG:
             device_id = unit["device_id"]
             personality = unit["personality"]
 
             if personality == "healthy":
                 # Normal operation, no faults, door closed
-                mask = (self.df["fault"] == "NORMAL") & (self.df["door_open"] == 0)
-                data = self.df[mask].copy()
+                row_idx = np.flatnonzero(normal_mask & ~self.df_arrays["door_open"])
 
             elif personality == "door_abuser":
-                # Mix of normal with door open events
-                normal_data = self.df[self.df["fault"] == "NORMAL"].copy()
-                # Artificially set door_open for ~30% of readings
-                data = normal_data.copy()
+                # Normal rows; door_open is synthesized per reading
+                row_idx = normal_idx
 
             elif personality == "dying_compressor":
-                # Look for high temperature readings or faults
-                # Simulate by taking normal data and adjusting temps upward
-                data = self.df[self.df["fault"] == "NORMAL"].copy()
+                # Normal rows; temps are adjusted upward per reading
+                row_idx = normal_idx
 
             elif personality == "frost_builder":
                 # High frost level readings
-                data = self.df[self.df["frost_level"] > 0.1].copy() if len(self.df[self.df["frost_level"] > 0.1]) > 100 else self.df.copy()
+                row_idx = (frost_indices if len(frost_indices) > 100
+                           else np.arange(len(self.df)))
 
             elif personality == "energy_hog":
                 # High power consumption
-                median_power = self.df["P_comp_W"].median()
-                data = self.df[self.df["P_comp_W"] > median_power].copy() if len(self.df[self.df["P_comp_W"] > median_power]) > 100 else self.df.copy()
+                hungry = np.flatnonzero(self.df_arrays["P_comp_W"] > median_power)
+                row_idx = hungry if len(hungry) > 100 else np.arange(len(self.df))
 
             else:
-                data = self.df.copy()
+                row_idx = np.arange(len(self.df))
 
-            # Reset index and store
-            data = data.reset_index(drop=True)
-            self.unit_data[device_id] = data
+            self.unit_row_idx[device_id] = row_idx
             self.unit_indices[device_id] = 0
-
-            print(f"  {device_id} ({personality}): {len(data):,} rows available")
-
-    def _add_jitter(self, value: float, jitter_pct: float = 0.02) -> float:
-        """Add random noise to a value for realism."""
-        jitter = value * jitter_pct * random.uniform(-1, 1)
-        return value + jitter
-
-    def _get_reading(self, unit: dict) -> dict:
+            self._unit_cache[device_id] = {
+                # Static portion of the output dict, copied per reading
+                "base": {
+                    "sensor_type": "freezer",
+                    "device_id": device_id,
+                    "lat": unit["lat"],
+                    "lon": unit["lon"],
+                    "location_name": unit["location_name"],
+                },
+                "fn": self._personality_fns.get(personality, self._read_passthrough),
+                "rows": row_idx,
+            }
+
+            print(f"  {device_id} ({personality}): {len(row_idx):,} rows available")
+
+        # With the masks built, keep the fault strings as a plain Python
+        # list: indexed list access hands back the interned str directly,
+        # where the object ndarray goes through NumPy's item machinery
+        self.df_arrays["fault"] = self.df_arrays["fault"].tolist()
+
+    def _batch_readings(self) -> list:
+        """Generate one iteration's readings for the whole fleet.
+
+        All random draws for the iteration are made in a single vectorized
+        call instead of one random.uniform() per field per unit, and all
+        units share one timestamp per iteration.
+        """
+        # Refill the preallocated buffer in place, then rescale [0, 1) to
+        # [-1, 1) without allocating temporaries
+        jitter = self._jitter_buf
+        self._rng.random(out=jitter)
+        np.multiply(jitter, 2.0, out=jitter)
+        np.subtract(jitter, 1.0, out=jitter)
+        ts = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%S.%fZ")
+        return [self._get_reading(unit, jitter[i], ts) for i, unit in enumerate(FLEET_CONFIG)]
+
+    def _read_healthy(self, idx: int, row: int, jitter: np.ndarray) -> tuple:
+        """Stable, slightly cold freezer."""
+        a = self.df_arrays
+        return _box_kernel_result(_healthy_kernel(
+            row, a["T_amb"], a["defrost_on"], a["P_comp_W"], a["N_comp_Hz"],
+            a["COP"], jitter))
+
+    def _read_door_abuser(self, idx: int, row: int, jitter: np.ndarray) -> tuple:
+        """30% chance the door is open; temperature rises when it is."""
+        a = self.df_arrays
+        return _box_kernel_result(_door_abuser_kernel(
+            row, a["T_amb"], a["defrost_on"], a["P_comp_W"], a["N_comp_Hz"],
+            a["frost_level"], a["COP"], jitter))
+
+    def _read_dying_compressor(self, idx: int, row: int, jitter: np.ndarray) -> tuple:
+        """Temperature slowly rising, high power; faults when too warm."""
+        a = self.df_arrays
+        return _box_kernel_result(_dying_compressor_kernel(
+            idx, row, a["T_amb"], a["door_open"], a["defrost_on"],
+            a["frost_level"], a["COP"], jitter))
+
+    def _read_frost_builder(self, idx: int, row: int, jitter: np.ndarray) -> tuple:
+        """High frost buildup, capped at 1.0."""
+        a = self.df_arrays
+        return _box_kernel_result(_frost_builder_kernel(
+            row, a["T_amb"], a["door_open"], a["defrost_on"], a["P_comp_W"],
+            a["N_comp_Hz"], a["COP"], jitter))
+
+    def _read_energy_hog(self, idx: int, row: int, jitter: np.ndarray) -> tuple:
+        """High power, low efficiency."""
+        a = self.df_arrays
+        return _box_kernel_result(_energy_hog_kernel(
+            row, a["T_amb"], a["door_open"], a["defrost_on"], a["N_comp_Hz"],
+            a["frost_level"], jitter))
+
+    def _read_passthrough(self, idx: int, row: int, jitter: np.ndarray) -> tuple:
+        """Unmodified reading straight from the dataset."""
+        arrs = self.df_arrays
+        return (
+            float(arrs["T_cab_meas"][row]), float(arrs["T_amb"][row]),
+            bool(arrs["door_open"][row]), bool(arrs["defrost_on"][row]),
+            float(arrs["P_comp_W"][row]), float(arrs["N_comp_Hz"][row]),
+            float(arrs["frost_level"][row]), float(arrs["COP"][row]),
+            arrs["fault"][row], int(arrs["fault_id"][row]),
+        )
+
+    def _get_reading(self, unit: dict, jitter: np.ndarray, ts: str) -> dict:
         """Get the next reading for a unit, applying personality modifications."""
         device_id = unit["device_id"]
-        personality = unit["personality"]
-
-        # Get data slice for this unit
-        data = self.unit_data[device_id]
+        cache = self._unit_cache[device_id]
+        rows = cache["rows"]
         idx = self.unit_indices[device_id]
 
         # Loop back to start if we've exhausted data
-        if idx >= len(data):
+        if idx >= len(rows):
             idx = 0
             self.unit_indices[device_id] = 0
 
-        row = data.iloc[idx]
         self.unit_indices[device_id] = idx + 1
 
-        # Base reading from CSV data
-        temp_cabinet = float(row["T_cab_meas"])
-        temp_ambient = float(row["T_amb"])
-        door_open = bool(row["door_open"])
-        defrost_on = bool(row["defrost_on"])
-        compressor_power = float(row["P_comp_W"])
-        compressor_freq = float(row["N_comp_Hz"])
-        frost_level = float(row["frost_level"])
-        cop = float(row["COP"])
-        fault = str(row["fault"])
-        fault_id = int(row["fault_id"])
-
-        # Apply personality-specific modifications
-        if personality == "healthy":
-            # Stable, slightly cold freezer
-            temp_cabinet = self._add_jitter(-18.0, 0.05)
-            door_open = False
-            fault = "NORMAL"
-            fault_id = 0
-            frost_level = self._add_jitter(0.05, 0.1)
-
-        elif personality == "door_abuser":
-            # 30% chance door is open
-            door_open = random.random() < 0.3
-            if door_open:
-                # Temperature rises when door is open
-                temp_cabinet = self._add_jitter(-12.0, 0.1)
-            else:
-                temp_cabinet = self._add_jitter(-17.0, 0.05)
-            fault = "NORMAL"
-            fault_id = 0
-
-        elif personality == "dying_compressor":
-            # Temperature slowly rising, high power
-            base_temp = -10.0 + (idx / 1000.0)  # Slowly rising
-            temp_cabinet = self._add_jitter(min(base_temp, 5.0), 0.1)
-            compressor_power = self._add_jitter(700.0, 0.1)
-            compressor_freq = self._add_jitter(95.0, 0.05)
-            # Fault when temp gets too high
-            if temp_cabinet > -5:
-                fault = "COMPRESSOR_FAIL"
-                fault_id = 3
-            else:
-                fault = "NORMAL"
-                fault_id = 0
-
-        elif personality == "frost_builder":
-            # High frost buildup
-            temp_cabinet = self._add_jitter(-16.0, 0.05)
-            frost_level = self._add_jitter(0.6, 0.1)
-            frost_level = min(frost_level, 1.0)  # Cap at 1.0
-            fault = "NORMAL"
-            fault_id = 0
-
-        elif personality == "energy_hog":
-            # High power, low efficiency
-            temp_cabinet = self._add_jitter(-17.0, 0.05)
-            compressor_power = self._add_jitter(650.0, 0.1)
-            cop = self._add_jitter(1.5, 0.1)  # Low efficiency
-            fault = "NORMAL"
-            fault_id = 0
-
-        # Add jitter to all values for realism
-        temp_cabinet = self._add_jitter(temp_cabinet, 0.01)
-        temp_ambient = self._add_jitter(temp_ambient, 0.02)
-
-        return {
-            "sensor_type": "freezer",
-            "device_id": device_id,
-            "lat": unit["lat"],
-            "lon": unit["lon"],
-            "location_name": unit["location_name"],
-            "temp_cabinet": round(temp_cabinet, 2),
-            "temp_ambient": round(temp_ambient, 2),
-            "door_open": door_open,
-            "defrost_on": defrost_on,
-            "compressor_power_w": round(compressor_power, 1),
-            "compressor_freq_hz": round(compressor_freq, 1),
-            "frost_level": round(frost_level, 3),
-            "cop": round(cop, 2),
-            "fault": fault,
-            "fault_id": fault_id,
-            "timestamp": datetime.utcnow().isoformat() + "Z"
-        }
-
-    def send_reading(self, reading: dict) -> bool:
-        """Send a reading to the server."""
+        (temp_cabinet, temp_ambient, door_open, defrost_on, compressor_power,
+         compressor_freq, frost_level, cop, fault, fault_id) = cache["fn"](
+            idx, rows[idx], jitter)
+
+        # Add jitter to all values for realism; fused multiply, no call
+        temp_cabinet *= 1.0 + 0.01 * jitter[0]
+        temp_ambient *= 1.0 + 0.02 * jitter[1]
+
+        reading = cache["base"].copy()
+        reading.update(
+            temp_cabinet=round(float(temp_cabinet), 2),
+            temp_ambient=round(float(temp_ambient), 2),
+            door_open=door_open,
+            defrost_on=defrost_on,
+            compressor_power_w=round(float(compressor_power), 1),
+            compressor_freq_hz=round(float(compressor_freq), 1),
+            frost_level=round(float(frost_level), 3),
+            cop=round(float(cop), 2),
+            fault=fault,
+            fault_id=fault_id,
+            timestamp=ts,
+        )
+        return reading
+
+    def send_reading_sync(self, reading: dict) -> bool:
+        """Send a reading to the server over the pooled blocking session."""
         try:
-            response = requests.post(
-                self.server_url,
-                json=reading,
-                headers={"Content-Type": "application/json"},
-                timeout=5
-            )
+            body = orjson.dumps(reading, option=orjson.OPT_SERIALIZE_NUMPY)
+            response = self._session.post(self.server_url, data=body, timeout=5)
             return response.status_code == 200
         except requests.exceptions.RequestException as e:
             print(f"Error sending data: {e}")
             return False
 
-    def run(self, interval: float = 5.0, test_mode: bool = False):
+    async def send_reading(self, session: aiohttp.ClientSession, reading: dict) -> bool:
+        """Send a reading to the server."""
+        try:
+            body = orjson.dumps(reading, option=orjson.OPT_SERIALIZE_NUMPY)
+            async with session.post(
+                self.server_url, data=body,
+                headers={"Content-Type": "application/json"}
+            ) as response:
+                return response.status == 200
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            print(f"Error sending data: {e}")
+            return False
+
+    async def run(self, interval: float = 5.0, test_mode: bool = False):
         """Run the simulator, streaming data at the specified interval."""
         print(f"\nStarting Subzero Fleet Simulator")
         print(f"Server: {self.server_url}")
@@ -249,14 +462,54 @@ class FreezerSimulator:
         print(f"Units: {len(FLEET_CONFIG)}")
         print("-" * 50)
 
+        iteration = 0
+        timeout = aiohttp.ClientTimeout(total=5)
+        async with aiohttp.ClientSession(timeout=timeout) as session:
+            while True:
+                iteration += 1
+                print(f"\n[Iteration {iteration}]")
+
+                readings = self._batch_readings()
+                # Fire all POSTs concurrently; the session keeps connections alive
+                results = await asyncio.gather(
+                    *[self.send_reading(session, reading) for reading in readings]
+                )
+
+                for reading, success in zip(readings, results):
+                    status_icon = "✓" if success else "✗"
+                    temp = reading["temp_cabinet"]
+                    fault = reading["fault"]
+                    door = "🚪" if reading["door_open"] else ""
+
+                    print(f"  {status_icon} {reading['device_id']} ({reading['location_name']}): {temp:.1f}°C {fault} {door}")
+
+                if test_mode:
+                    print("\nTest mode - exiting after one iteration")
+                    break
+
+                await asyncio.sleep(interval)
+
+    def run_sync(self, interval: float = 5.0, test_mode: bool = False):
+        """Blocking variant of run() using the pooled requests session."""
+        print(f"\nStarting Subzero Fleet Simulator (sync)")
+        print(f"Server: {self.server_url}")
+        print(f"Interval: {interval} seconds")
+        print(f"Units: {len(FLEET_CONFIG)}")
+        print("-" * 50)
+
         iteration = 0
         while True:
             iteration += 1
             print(f"\n[Iteration {iteration}]")
 
-            for unit in FLEET_CONFIG:
-                reading = self._get_reading(unit)
-                success = self.send_reading(reading)
+            readings = self._batch_readings()
+            # Fire all POSTs in parallel; the pooled session is thread-safe
+            # and sized to the fleet
+            futures = [self._executor.submit(self.send_reading_sync, reading)
+                       for reading in readings]
+
+            for reading, future in zip(readings, futures):
+                success = future.result()
 
                 status_icon = "✓" if success else "✗"
                 temp = reading["temp_cabinet"]
@@ -295,6 +548,16 @@ def main():
         action="store_true",
         help="Test mode - run one iteration and exit"
     )
+    parser.add_argument(
+        "--sync",
+        action="store_true",
+        help="Use the blocking requests session instead of asyncio"
+    )
+    parser.add_argument(
+        "--cache",
+        action="store_true",
+        help="Cache the CSV as Parquet and memory-map it on subsequent runs"
+    )
 
     args = parser.parse_args()
 
@@ -308,8 +571,11 @@ def main():
         return 1
 
     simulator = FreezerSimulator(str(csv_path), args.server)
-    simulator.load_data()
-    simulator.run(interval=args.interval, test_mode=args.test)
+    simulator.load_data(use_cache=args.cache)
+    if args.sync:
+        simulator.run_sync(interval=args.interval, test_mode=args.test)
+    else:
+        asyncio.run(simulator.run(interval=args.interval, test_mode=args.test))
 
     return 0
 